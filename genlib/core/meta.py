@@ -76,3 +76,29 @@ def provides(*outputs):
         return function
 
     return decorate
+
+
+def blocking(function):
+    """Mark a method as blocking so it runs in the scheduler's thread pool.  This is
+    the default for all methods not declared with `async def`.
+    """
+    assert not inspect.iscoroutinefunction(function), "Expected a regular function."
+    config = vars(function).setdefault(CONFIG_ATTRIBUTE, {})
+    config["blocking"] = True
+    return function
+
+
+def batching(max_size=64, timeout=0.0):
+    """Mark a method as able to compute multiple requests in one call.  It's called
+    with the number of queued requests as argument, and must return a list with
+    one result for each of them.
+    """
+
+    def decorate(function):
+        assert max_size > 0 and timeout >= 0.0
+        config = vars(function).setdefault(CONFIG_ATTRIBUTE, {})
+        assert "batching" not in config
+        config["batching"] = {"max_size": max_size, "timeout": timeout}
+        return function
+
+    return decorate
@@ -7,6 +7,8 @@ class Variable:
     """Base class that describes a `Skill` input or output.
     """
 
+    hidden = ("type",)
+
     def __init__(self, name: str, *, spec: str, desc: str = ""):
         self.name = name
         self.spec = spec
@@ -15,7 +17,7 @@ class Variable:
         self.type = create_type(spec)
 
     def as_dict(self):
-        return {k: v for k, v in self.__dict__.items() if k not in ["type"]}
+        return {k: v for k, v in self.__dict__.items() if k not in self.hidden}
 
 
 class SkillOutput(Variable):
@@ -24,12 +26,27 @@ class SkillOutput(Variable):
 
 
 class SkillInput(Variable):
-    """Schema describing a single input of a `Skill`.
+    """Schema describing a single input of a `Skill`.  The capacity and policy
+    configure how many messages are queued for the skill, and what happens to the
+    publisher once the queue is full; see `QueueSubscription` for details.
     """
 
-    def __init__(self, name: str, *, spec: str, defaults: list = [], desc: str = ""):
+    hidden = ("type", "capacity", "policy")
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        spec: str,
+        defaults: list = [],
+        desc: str = "",
+        capacity: int = 0,
+        policy: str = "block",
+    ):
         super(SkillInput, self).__init__(name=name, spec=spec, desc=desc)
         self.defaults = defaults
+        self.capacity = capacity
+        self.policy = policy
 
 
 class SkillSchema:
@@ -1,10 +1,10 @@
 # genlib — Copyright (c) 2019, Alex J. Champandard. Code licensed under the GNU AGPLv3.
 
-from .meta import SkillConfigurator, provides, watching
+from .meta import SkillConfigurator, provides, watching, batching, blocking
 from .schema import SkillInput, SkillOutput
 
 
-__all__ = ["Skill", "Input", "Output", "provides", "watching"]
+__all__ = ["Skill", "Input", "Output", "provides", "watching", "batching", "blocking"]
 
 
 class BaseSkill(metaclass=SkillConfigurator):
@@ -1,9 +1,44 @@
 # genlib — Copyright (c) 2019, Alex J. Champandard. Code licensed under the GNU AGPLv3.
 
+import os
 import uuid
+import itertools
+
+
+# Identifiers combine a random prefix for this process with a sequence number.
+_node, _sequence = uuid.uuid4().int >> 64, itertools.count()
+
+
+def _reset_sequence():
+    global _node, _sequence  # pylint: disable=global-statement
+    _node, _sequence = uuid.uuid4().int >> 64, itertools.count()
+
+
+# Forked worker processes must not reuse the same identifiers as their parent.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_sequence)
 
 
 class Item:
+    __slots__ = ("data", "_node", "_index", "_uuid")
+
     def __init__(self, data):
-        self.uuid = uuid.uuid1()
         self.data = data
+        self._node = _node
+        self._index = next(_sequence)
+        self._uuid = None
+
+    @property
+    def uuid(self):
+        """Unique identifier of this item, only created as `UUID` object if needed.
+        """
+        if self._uuid is None:
+            self._uuid = uuid.UUID(int=(self._node << 64) | self._index)
+        return self._uuid
+
+    def __getstate__(self):
+        return (self.data, self._node, self._index)
+
+    def __setstate__(self, state):
+        self.data, self._node, self._index = state
+        self._uuid = None
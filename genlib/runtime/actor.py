@@ -24,8 +24,14 @@ class Actor:
     async def push_skill_input(self, skill, key, value):
         await self.interpreter.push_skill_input(skill, key, Item(value))
 
-    async def pull_skill_output(self, skill, key):
-        return await self.interpreter.pull_skill_output(skill, key)
+    async def pull_skill_output(self, skill, key, subscription=None):
+        return await self.interpreter.pull_skill_output(skill, key, subscription)
+
+    def subscribe_skill_output(self, skill, key):
+        return self.interpreter.subscribe_skill_output(skill, key)
+
+    def unsubscribe_skill_output(self, skill, key, subscription):
+        self.interpreter.unsubscribe_skill_output(skill, key, subscription)
 
     async def invoke(self, command, parameters):
         uri = self.listing[command]
@@ -16,12 +16,32 @@ class CallbackSubscription:
         pass
 
 
+QUEUE_POLICIES = ("block", "drop_oldest", "drop_newest", "latest")
+
+
 class QueueSubscription:
-    def __init__(self, channel):
+    """Subscription that stores messages until they are received.  When the queue
+    reaches its capacity, the policy either blocks the publisher, drops the oldest
+    or newest message, or only keeps the latest message.
+    """
+
+    def __init__(self, channel, capacity=0, policy="block"):
+        assert policy in QUEUE_POLICIES, f"Unknown queue policy `{policy}`."
         self.channel = channel
-        self._queue = asyncio.Queue()
+        self.policy = policy
+        self.dropped = 0
+        self._queue = asyncio.Queue(maxsize=1 if policy == "latest" else capacity)
 
     async def process(self, message):
+        if self.policy == "block":
+            await self._queue.put(message)
+            return
+
+        if self._queue.full():
+            self.dropped += 1
+            if self.policy == "drop_newest":
+                return
+            self._queue.get_nowait()
         self._queue.put_nowait(message)
 
     async def get(self):
@@ -30,6 +50,8 @@ class QueueSubscription:
         return await self._queue.get()
 
     def cancel(self):
+        if self._queue.full():
+            self._queue.get_nowait()
         self._queue.put_nowait(None)
 
 
@@ -40,7 +62,18 @@ class Channel:
     def __init__(self, key):
         self.key = key
         self.provider: Provider = None
-        self.subscriptions = []
+        self.subscriptions = {}  # Insertion-ordered set, indexed by identity.
+        self.callbacks = {}
+
+    def add(self, sub):
+        self.subscriptions[sub] = None
+        return sub
+
+    def remove(self, sub):
+        del self.subscriptions[sub]
+        callback = getattr(sub, "_callback", None)
+        if self.callbacks.get(callback) is sub:
+            del self.callbacks[callback]
 
     async def provide(self):
         if self.provider is None:
@@ -55,12 +88,27 @@ class Channel:
         # Each of the listen() tasks unsubscribe themselves automatically.
 
 
+class PublishError(Exception):
+    """Raised once a message was delivered to all subscribers concurrently, if any of
+    them failed to process it.  Stores the exception raised by each subscription.
+    """
+
+    def __init__(self, channel_key, errors):
+        super(PublishError, self).__init__(
+            f"{len(errors)} subscriber(s) of `{channel_key}` failed processing."
+        )
+        self.errors = errors
+
+
 class Broker:
-    """Simple message broker that allows subscribing and publishing to channels.
+    """Simple message broker that allows subscribing and publishing to channels.  With
+    a concurrency above one, messages are delivered to that many subscribers at once,
+    so a single slow subscriber doesn't delay all others.
     """
 
-    def __init__(self):
+    def __init__(self, concurrency=1):
         self._channels = {}
+        self.concurrency = concurrency
 
     def create_channel(self, key):
         assert key not in self._channels
@@ -81,23 +129,46 @@ class Broker:
 
     def add_callback(self, channel_key, callback):
         channel = self.get_channel(channel_key)
-        sub = CallbackSubscription(channel, callback)
-        channel.subscriptions.append(sub)
+        assert callback not in channel.callbacks, "Callback already registered."
+        sub = channel.add(CallbackSubscription(channel, callback))
+        channel.callbacks[callback] = sub
         return sub
 
     def remove_callback(self, channel_key, callback):
         channel = self.get_channel(channel_key)
-        for sub in channel.subscriptions:
-            if getattr(sub, "_callback", None) == callback:
-                channel.subscriptions.remove(sub)
-                break
+        sub = channel.callbacks.get(callback)
+        if sub is not None:
+            channel.remove(sub)
 
     async def publish(self, channel_key, message):
         channel = self.get_channel(channel_key)
         assert len(channel.subscriptions) > 0
 
-        for sub in channel.subscriptions:
-            await sub.process(message)
+        # Subscriptions may be added or removed while each message is processed.
+        subscriptions = tuple(channel.subscriptions)
+        if self.concurrency <= 1 or len(subscriptions) == 1:
+            for sub in subscriptions:
+                await sub.process(message)
+        else:
+            await self._publish_concurrently(channel_key, subscriptions, message)
+
+    async def _publish_concurrently(self, channel_key, subscriptions, message):
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def process(sub):
+            async with semaphore:
+                await sub.process(message)
+
+        results = await asyncio.gather(
+            *[process(sub) for sub in subscriptions], return_exceptions=True
+        )
+        errors = [
+            (sub, res)
+            for sub, res in zip(subscriptions, results)
+            if isinstance(res, Exception)
+        ]
+        if len(errors) > 0:
+            raise PublishError(channel_key, errors)
 
     async def receive(self, channel_key, subscription=None):
         try:
@@ -115,12 +186,14 @@ class Broker:
         channel = self.get_channel(channel_key)
         return len(channel.subscriptions)
 
-    def subscribe(self, channel_key):
+    def get_dropped_count(self, channel_key):
         channel = self.get_channel(channel_key)
-        sub = QueueSubscription(channel)
-        channel.subscriptions.append(sub)
-        return sub
+        return sum(getattr(sub, "dropped", 0) for sub in channel.subscriptions)
+
+    def subscribe(self, channel_key, capacity=0, policy="block"):
+        channel = self.get_channel(channel_key)
+        return channel.add(QueueSubscription(channel, capacity, policy))
 
     def unsubscribe(self, channel_key, sub):
         channel = self.get_channel(channel_key)
-        channel.subscriptions.remove(sub)
+        channel.remove(sub)
@@ -1,5 +1,7 @@
 # genlib — Copyright (c) 2019, Alex J. Champandard. Code licensed under the GNU AGPLv3.
 
+import asyncio
+
 from .broker import Broker
 from .scheduler import Scheduler
 
@@ -12,10 +14,17 @@ class Facade:
     def __init__(self, interpreter, skill):
         self._interpreter = interpreter
         self._skill = skill
+        self._loop = asyncio.get_event_loop()
 
     async def pull_inputs(self, *keys):
         return [await self._interpreter.pull_skill_input(self._skill, k) for k in keys]
 
+    def pull_inputs_blocking(self, *keys):
+        """Version of `pull_inputs` for blocking methods running in a worker thread.
+        """
+        coro = self.pull_inputs(*keys)
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
 
 class Interpreter:
     """Manages the execution and communication of multiple skills.
@@ -31,7 +40,9 @@ class Interpreter:
         for inpt in skill.inputs:
             key = (skill, inpt.name)
             self.broker.create_channel(key)
-            self.subscriptions[key] = self.broker.subscribe(channel_key=key)
+            self.subscriptions[key] = self.broker.subscribe(
+                channel_key=key, capacity=inpt.capacity, policy=inpt.policy
+            )
             self._setup_watcher(skill, inpt.name)
 
         for outpt in skill.outputs:
@@ -74,8 +85,19 @@ class Interpreter:
     async def push_skill_input(self, skill, key, value):
         await self.broker.publish(channel_key=(skill, key), message=value)
 
-    async def pull_skill_output(self, skill, key):
-        return await self.broker.receive(channel_key=(skill, key))
+    def get_dropped_count(self, skill, key):
+        return self.broker.get_dropped_count((skill, key))
+
+    async def pull_skill_output(self, skill, key, subscription=None):
+        return await self.broker.receive(
+            channel_key=(skill, key), subscription=subscription
+        )
+
+    def subscribe_skill_output(self, skill, key):
+        return self.broker.subscribe(channel_key=(skill, key))
+
+    def unsubscribe_skill_output(self, skill, key, subscription):
+        self.broker.unsubscribe(channel_key=(skill, key), sub=subscription)
 
     def connect(self, output_skill, output_key, input_skill, input_key):
         # Use provider for the second skill to use the first skill
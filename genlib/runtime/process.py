@@ -0,0 +1,130 @@
+# genlib — Copyright (c) 2019, Alex J. Champandard. Code licensed under the GNU AGPLv3.
+
+import asyncio
+import inspect
+import multiprocessing
+
+from .scheduler import Runner, Scheduler
+
+
+__all__ = ["ProcessScheduler"]
+
+
+class PipeFacade:
+    """Replacement for the interpreter's `Facade` inside a worker process, which
+    requests the inputs from the parent process over the pipe.
+    """
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    async def pull_inputs(self, *keys):
+        return self.pull_inputs_blocking(*keys)
+
+    def pull_inputs_blocking(self, *keys):
+        self._conn.send(("pull", keys))
+        return self._conn.recv()
+
+
+class ProcessRunner(Runner):
+    """Manages the execution of a Skill that's hosted in a separate worker process,
+    forwarding every step and input request over a pipe.
+    """
+
+    def __init__(self, skill, context):
+        super(ProcessRunner, self).__init__(skill)
+        self._context = context
+        self._conn = None
+        self._process = None
+        self._busy = False
+
+    async def initialize(self):
+        self._conn, child = self._context.Pipe()
+        self._process = self._context.Process(
+            target=serve, args=(child, self.skill), daemon=True
+        )
+        self._process.start()
+        child.close()
+        await self._exchange("initialize")
+
+    async def shutdown(self):
+        # The worker can't be stopped cleanly when interrupted in the middle of a step.
+        if self._busy:
+            self._process.terminate()
+        else:
+            await self._exchange("shutdown")
+        self._process.join()
+        self._conn.close()
+
+    async def call(self, function, *args):
+        return await self._exchange("call", function.__name__, *args)
+
+    async def _exchange(self, command, *args):
+        """Send a command to the worker, then provide it with the inputs it requests
+        until the command has completed.
+        """
+        try:
+            self._busy = True
+            self._conn.send((command, args))
+            while True:
+                reply, value = await self._receive()
+                if reply == "pull":
+                    self._conn.send(await self.skill.io.pull_inputs(*value))
+                    continue
+                if reply == "error":
+                    raise value
+                return value
+        finally:
+            self._busy = False
+
+    async def _receive(self):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self._conn.recv)
+
+
+def serve(conn, skill):
+    """Entry point of the worker process, which runs its own event loop."""
+    skill.io = PipeFacade(conn)
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(_serve(conn, skill))
+    finally:
+        loop.close()
+        conn.close()
+
+
+async def _serve(conn, skill):
+    while True:
+        command, args = conn.recv()
+        try:
+            if command == "call":
+                function = getattr(type(skill), args[0])
+                result = function(skill, *args[1:])
+                if inspect.isawaitable(result):
+                    result = await result
+            else:
+                result = await getattr(skill, "on_" + command)()
+            conn.send(("done", result))
+        except Exception as exc:  # pylint: disable=broad-except
+            conn.send(("error", exc))
+
+        if command == "shutdown":
+            break
+
+
+class ProcessScheduler(Scheduler):
+    """Handles the execution of recipes, hosting the selected skills in worker
+    processes so CPU-bound methods don't block the event loop.  Worker processes are
+    forked, so skills loaded dynamically by the registry are available there too.
+    """
+
+    def __init__(self, on_compute=None, isolate=None):
+        super(ProcessScheduler, self).__init__(on_compute)
+        self.isolate = isolate or (lambda _: True)
+        self._context = multiprocessing.get_context("fork")
+
+    def create_runner(self, skill):
+        if not self.isolate(skill):
+            return super(ProcessScheduler, self).create_runner(skill)
+        return ProcessRunner(skill, self._context)
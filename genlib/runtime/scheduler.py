@@ -1,6 +1,14 @@
 # genlib — Copyright (c) 2019, Alex J. Champandard. Code licensed under the GNU AGPLv3.
 
 import asyncio
+import inspect
+import collections
+import concurrent.futures
+
+from ..core.meta import CONFIG_ATTRIBUTE
+
+
+Request = collections.namedtuple("Request", ["function", "future"])
 
 
 class Runner:
@@ -8,32 +16,97 @@ class Runner:
     and shutdown appropriately.
     """
 
-    def __init__(self, skill):
+    def __init__(self, skill, threads=None):
         self.skill = skill
+        self.threads = threads or ThreadPool()
         self.request_queue = asyncio.Queue()
         self.result_queue = asyncio.Queue()
+        self._pending = None
         self._task = None
 
     async def step(self, function):
-        self.request_queue.put_nowait(function)
-        return await self.result_queue.get()
+        future = asyncio.get_event_loop().create_future()
+        self.request_queue.put_nowait(Request(function, future))
+        return await future
 
-    async def run(self):
+    async def initialize(self):
         await self.skill.on_initialize()
+
+    async def shutdown(self):
+        await self.skill.on_shutdown()
+
+    async def call(self, function, *args):
+        if is_blocking(function):
+            return await self.threads.call(function, self.skill, *args)
+        return await function(self.skill, *args)
+
+    async def run(self):
+        await self.initialize()
         self.result_queue.put_nowait("initialize")
         try:
             while True:
-                function = await self.request_queue.get()
-                result = await function(self.skill)
-                await self.result_queue.put(result)
+                batch = await self._next_batch()
+                await self._execute(batch)
         except asyncio.CancelledError:
             pass
-        except Exception as exc:  # pylint: disable=broad-except
-            self.result_queue.put_nowait(exc)
+        except Exception:  # pylint: disable=broad-except
+            pass  # The exception was already passed on to the callers.
         finally:
-            await self.skill.on_shutdown()
+            await self.shutdown()
             self.result_queue.put_nowait("shutdown")
 
+    async def _execute(self, batch):
+        function = batch[0].function
+        try:
+            if get_batching(function) is None:
+                results = [await self.call(function)]
+            else:
+                results = await self.call(function, len(batch))
+                assert len(results) == len(batch), "Expected one result per request."
+        except Exception as exc:
+            self._resolve(batch, [exc] * len(batch))
+            raise
+        self._resolve(batch, results)
+
+    def _resolve(self, batch, results):
+        for request, result in zip(batch, results):
+            if not request.future.done():
+                request.future.set_result(result)
+
+    async def _next_batch(self):
+        """Fetch the next request, then collect all the following requests for the
+        same function if it supports batching, until the size or deadline is reached.
+        """
+        first, self._pending = self._pending, None
+        if first is None:
+            first = await self.request_queue.get()
+
+        config = get_batching(first.function)
+        if config is None:
+            return [first]
+
+        batch, loop = [first], asyncio.get_event_loop()
+        deadline = loop.time() + config["timeout"]
+        while len(batch) < config["max_size"]:
+            if self.request_queue.qsize() > 0:
+                request = self.request_queue.get_nowait()
+            else:
+                remaining = deadline - loop.time()
+                if remaining <= 0.0:
+                    break
+                try:
+                    request = await asyncio.wait_for(
+                        self.request_queue.get(), remaining
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            if request.function is not first.function:
+                self._pending = request
+                break
+            batch.append(request)
+        return batch
+
     async def start(self):
         self._task = asyncio.create_task(self.run())
         await self.result_queue.get()
@@ -43,16 +116,63 @@ class Runner:
         await self.result_queue.get()
 
 
+class ThreadPool:
+    """Bounded pool of threads that runs the blocking methods of skills, so they
+    don't stall the event loop.
+    """
+
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self.pending = 0
+        self._executor = None
+
+    async def call(self, function, *args):
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix="genlib"
+            )
+
+        self.pending += 1
+        try:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(self._executor, function, *args)
+        finally:
+            self.pending -= 1
+
+    def get_queue_depth(self):
+        """Number of calls that are waiting for a thread to become available.
+        """
+        return max(0, self.pending - self.max_workers)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+def get_batching(function):
+    return getattr(function, CONFIG_ATTRIBUTE, {}).get("batching")
+
+
+def is_blocking(function):
+    config = getattr(function, CONFIG_ATTRIBUTE, {})
+    return config.get("blocking", False) or not inspect.iscoroutinefunction(function)
+
+
 class Scheduler:
     """Handles the execution of recipes, as a set of asynchronous coroutines.
     """
 
-    def __init__(self, on_compute=None):
+    def __init__(self, on_compute=None, max_threads=4):
         self._runners = {}
         self.on_compute = on_compute
+        self.threads = ThreadPool(max_threads)
+
+    def create_runner(self, skill):
+        return Runner(skill, self.threads)
 
     async def spawn(self, skill):
-        runner = Runner(skill)
+        runner = self.create_runner(skill)
         await runner.start()
         self._runners[id(skill)] = runner
 
@@ -74,11 +194,15 @@ class Scheduler:
     def get_active_skill_count(self):
         return len(self._runners)
 
+    def get_thread_queue_depth(self):
+        return self.threads.get_queue_depth()
+
     async def halt(self, skill):
         runner = self._runners.pop(id(skill))
         await runner.stop()
 
     async def shutdown(self):
         if len(self._runners) > 0:
-            await asyncio.wait([r.stop() for r in self._runners.values()])
+            await asyncio.gather(*[r.stop() for r in self._runners.values()])
             self._runners.clear()
+        self.threads.shutdown()
@@ -3,20 +3,27 @@
 import uuid
 import aiohttp.web
 
+from .protocol import find_codec, list_codecs
+
 
 class Client:
-    def __init__(self, url):
+    def __init__(self, url, codecs=None):
         self.url = url
+        self.codecs = codecs or list_codecs()
+        self.codec = None
         self.session = None
         self.connection = None
 
     async def __aenter__(self):
         self.session = aiohttp.ClientSession()
         try:
-            self.connection = await self.session.ws_connect(self.url)
+            self.connection = await self.session.ws_connect(
+                self.url, protocols=self.codecs
+            )
         except:
             await self.session.close()
             raise
+        self.codec = find_codec(self.connection.protocol)
         return self
 
     async def __aexit__(self, *exc_info):
@@ -24,9 +31,24 @@ class Client:
         await self.session.close()
         self.session = None
 
+    async def send(self, msg):
+        """Send a message encoded with the codec negotiated for this connection.
+        """
+        data = self.codec.encode(msg)
+        if isinstance(data, str):
+            await self.connection.send_str(data)
+        else:
+            await self.connection.send_bytes(data)
+
+    async def receive(self):
+        msg = await self.connection.receive()
+        if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+            return self.codec.decode(msg.data)
+        raise ConnectionError(f"Unexpected websocket message of type `{msg.type}`.")
+
     async def get_listing(self):
-        await self.connection.send_json({"type": "listing"})
-        return await self.connection.receive_json()
+        await self.send({"type": "listing"})
+        return await self.receive()
 
     async def invoke(self, command, parameters=None):
         msg = {
@@ -35,17 +57,83 @@ class Client:
             "parameters": parameters or {},
             "uuid": uuid.uuid1().hex,
         }
-        await self.connection.send_json(msg)
-        return await self.connection.receive_json()
+        await self.send(msg)
+        return await self.receive()
 
     async def revoke(self, skill):
-        await self.connection.send_json({"type": "revoke", "uuid": skill["uuid"]})
+        await self.send({"type": "revoke", "uuid": skill["uuid"]})
 
     async def push_input(self, skill, key, value):
         msg = {"type": "push_input", "uuid": skill["uuid"], "data": {key: value}}
-        await self.connection.send_json(msg)
+        await self.send(msg)
 
     async def pull_output(self, skill, key):
         msg = {"type": "pull_output", "uuid": skill["uuid"], "key": key}
-        await self.connection.send_json(msg)
-        return await self.connection.receive_json()
+        await self.send(msg)
+        return await self.receive()
+
+    def subscribe_output(self, skill, key, credit=8):
+        """Stream the values of a skill's output as they are pushed by the server.
+        The connection must not be used for other requests until the stream is closed.
+        """
+        return OutputStream(self, skill, key, credit)
+
+
+class OutputStream:
+    """Asynchronous iterator over the values of a skill's output.  The server pushes
+    up to `credit` values in advance, and more credit is granted as they're consumed.
+    """
+
+    def __init__(self, client, skill, key, credit):
+        self.client = client
+        self.stream = uuid.uuid1().hex
+        self._request = {
+            "type": "subscribe_output",
+            "uuid": skill["uuid"],
+            "key": key,
+            "stream": self.stream,
+            "credit": credit,
+        }
+        self._threshold = max(1, credit // 2)
+        self._consumed = 0
+        self._closed = False
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._closed:
+            raise StopAsyncIteration
+
+        msg = await self.client.receive()
+        if msg["type"] == "unsubscribed":
+            self._closed = True
+            raise StopAsyncIteration
+
+        self._consumed += 1
+        if self._consumed >= self._threshold:
+            await self._grant_credit()
+        return msg
+
+    async def open(self):
+        await self.client.send(self._request)
+
+    async def close(self):
+        if self._closed:
+            return
+        await self.client.send({"type": "unsubscribe_output", "stream": self.stream})
+        while (await self.client.receive())["type"] != "unsubscribed":
+            pass  # Values that were pushed before the stream was closed.
+        self._closed = True
+
+    async def _grant_credit(self):
+        msg = {"type": "grant_credit", "stream": self.stream, "credit": self._consumed}
+        await self.client.send(msg)
+        self._consumed = 0
@@ -0,0 +1,140 @@
+# genlib — Copyright (c) 2019, Alex J. Champandard. Code licensed under the GNU AGPLv3.
+
+import json
+import struct
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+__all__ = ["encode_frame", "decode_frame", "find_codec", "list_codecs"]
+
+
+BUFFER_KEY = "$buffer"
+BUFFER_FIELDS = ("data", "parameters")
+HEADER_SIZE = struct.Struct("!I")
+
+
+def is_binary(value):
+    return isinstance(value, (bytes, bytearray, memoryview))
+
+
+def encode_frame(msg: dict):
+    """Serialize a message containing binary data as a websocket frame: the size of
+    the header, then the JSON header itself, then each raw buffer.  Returns `None` if
+    the message has no binary data and can be sent as JSON directly.
+
+    Binary values are supported in the message's data or parameters, either directly
+    or as values of a dictionary, for instance `{"data": {"image": b"..."}}`.
+    """
+    buffers = []
+
+    def extract(value):
+        if not is_binary(value):
+            return value
+        buffers.append(memoryview(value).cast("B"))
+        return {BUFFER_KEY: len(buffers) - 1}
+
+    header = dict(msg)
+    for field in [f for f in BUFFER_FIELDS if f in msg]:
+        value = msg[field]
+        if isinstance(value, dict):
+            header[field] = {k: extract(v) for k, v in value.items()}
+        else:
+            header[field] = extract(value)
+
+    if len(buffers) == 0:
+        return None
+
+    header["buffers"] = [b.nbytes for b in buffers]
+    header = json.dumps(header).encode("utf-8")
+    return b"".join([HEADER_SIZE.pack(len(header)), header] + buffers)
+
+
+def decode_frame(frame: bytes):
+    """Parse a binary websocket frame into a message, where binary data are views
+    into the frame's memory so the buffers aren't copied.
+    """
+    view = memoryview(frame)
+    (size,) = HEADER_SIZE.unpack_from(view)
+    offset = HEADER_SIZE.size + size
+    msg = json.loads(bytes(view[HEADER_SIZE.size : offset]).decode("utf-8"))
+
+    buffers = []
+    for length in msg.pop("buffers", []):
+        buffers.append(view[offset : offset + length])
+        offset += length
+
+    def restore(value):
+        if isinstance(value, dict) and BUFFER_KEY in value:
+            return buffers[value[BUFFER_KEY]]
+        return value
+
+    for field in [f for f in BUFFER_FIELDS if f in msg]:
+        value = msg[field]
+        if isinstance(value, dict) and BUFFER_KEY not in value:
+            msg[field] = {k: restore(v) for k, v in value.items()}
+        else:
+            msg[field] = restore(value)
+    return msg
+
+
+class JsonCodec:
+    """Default codec that sends messages as JSON text, using `orjson` if installed,
+    and messages containing binary data as binary frames.
+    """
+
+    name = "genlib.json"
+
+    def encode(self, msg: dict):
+        frame = encode_frame(msg)
+        if frame is not None:
+            return frame
+        if orjson is not None:
+            return orjson.dumps(msg, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        return json.dumps(msg)
+
+    def decode(self, data):
+        if isinstance(data, str):
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        return decode_frame(data)
+
+
+class MsgpackCodec:
+    """Compact codec that sends all messages as binary frames, only available if
+    `msgpack` is installed.  Binary data is decoded as `bytes`.
+    """
+
+    name = "genlib.msgpack"
+
+    def encode(self, msg: dict):
+        return msgpack.packb(msg, use_bin_type=True)
+
+    def decode(self, data):
+        return msgpack.unpackb(data, raw=False)
+
+
+CODECS = [MsgpackCodec(), JsonCodec()] if msgpack is not None else [JsonCodec()]
+
+
+def list_codecs():
+    """Names of the available codecs, in order of preference.
+    """
+    return [c.name for c in CODECS]
+
+
+def find_codec(name):
+    """Codec for the negotiated websocket protocol, or JSON if there was none.
+    """
+    for codec in CODECS:
+        if codec.name == name:
+            return codec
+    assert name is None, f"Unknown codec `{name}`."
+    return CODECS[-1]
@@ -4,6 +4,7 @@ import asyncio
 import aiohttp.web
 
 from .session import UserSession
+from .protocol import list_codecs
 from ..runtime.actor import Actor
 from ..runtime.registry import LocalRegistry
 
@@ -27,7 +28,7 @@ class Server(aiohttp.web.Application):
         self.listing[alias] = uri
 
     async def serve_session(self, request):
-        websock = aiohttp.web.WebSocketResponse()
+        websock = aiohttp.web.WebSocketResponse(protocols=list_codecs())
         await websock.prepare(request)
 
         actor = Actor(self.registry, self.listing)
@@ -50,7 +51,7 @@ class Server(aiohttp.web.Application):
             await session.shutdown()
 
         if len(self.sessions) > 0:
-            await asyncio.wait([close(session) for session in self.sessions])
+            await asyncio.gather(*[close(session) for session in self.sessions])
         assert len(self.sessions) == 0
 
     def make_session(self, *args, **kwargs):
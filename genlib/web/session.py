@@ -2,16 +2,24 @@
 
 import asyncio
 import logging
+import collections
 
 import aiohttp.web
 
+from .protocol import find_codec
+
+
+Stream = collections.namedtuple("Stream", ["task", "credit"])
+
 
 class UserSession:
     def __init__(self, websock, actor):
         self.log = logging.getLogger("genlib.session")
         self.websock = websock
+        self.codec = find_codec(getattr(websock, "ws_protocol", None))
         self.actor = actor
         self.skills = {}
+        self.streams = {}
         self._tasks = []
 
     async def run(self):
@@ -19,19 +27,31 @@ class UserSession:
         asynchronous task to keep the websocket connection responsive.
         """
         async for msg in self.websock:
-            if msg.type == aiohttp.web.WSMsgType.TEXT:
-                task = asyncio.create_task(self._process(msg.json()))
+            if msg.type in (aiohttp.web.WSMsgType.TEXT, aiohttp.web.WSMsgType.BINARY):
+                task = asyncio.create_task(self._process(self.codec.decode(msg.data)))
                 self._tasks.append(task)
             if msg.type == aiohttp.web.WSMsgType.CLOSE:
                 break
 
+        for stream in self.streams.values():
+            stream.task.cancel()
         if len(self._tasks) > 0:
             await asyncio.wait(self._tasks)
 
     async def shutdown(self):
-        assert len(self._tasks) == 0
+        if len(self._tasks) > 0:
+            await asyncio.wait(self._tasks)
         await self.actor.shutdown()
 
+    async def send(self, msg: dict):
+        """Send a message encoded with the codec negotiated for this connection.
+        """
+        data = self.codec.encode(msg)
+        if isinstance(data, str):
+            await self.websock.send_str(data)
+        else:
+            await self.websock.send_bytes(data)
+
     async def _process(self, msg: dict):
         """Process a websocket request by finding the appropriate message handler.
         """
@@ -45,7 +65,7 @@ class UserSession:
 
     async def handle_listing(self, _: dict):
         listing = self.actor.get_listing()
-        await self.websock.send_json({"type": "listing", "data": listing})
+        await self.send({"type": "listing", "data": listing})
 
     async def handle_connect(self, msg: dict):
         pass
@@ -53,7 +73,7 @@ class UserSession:
     async def handle_invoke(self, msg: dict):
         skill = await self.actor.invoke(msg["command"], msg.get("parameters", {}))
         self.skills[msg["uuid"]] = skill
-        await self.websock.send_json({"type": "invoked", "uuid": msg["uuid"]})
+        await self.send({"type": "invoked", "uuid": msg["uuid"]})
 
     async def handle_revoke(self, msg: dict):
         skill = self.skills[msg["uuid"]]
@@ -67,9 +87,51 @@ class UserSession:
     async def handle_pull_output(self, msg: dict):
         skill = self.skills[msg["uuid"]]
         output = await self.actor.pull_skill_output(skill, msg["key"])
-        await self.websock.send_json(
+        await self.send(
             {"type": "pulled_output", "uuid": msg["uuid"], "data": output.data}
         )
 
+    async def handle_subscribe_output(self, msg: dict):
+        """Push values of a skill's output to the client, as long as it has credit.
+        The client grants more credit as it consumes the values.
+        """
+        skill, stream = self.skills[msg["uuid"]], msg["stream"]
+        credit = asyncio.Semaphore(msg.get("credit", 1))
+        self.streams[stream] = Stream(asyncio.current_task(), credit)
+
+        sub = self.actor.subscribe_skill_output(skill, msg["key"])
+        try:
+            while True:
+                await credit.acquire()
+                output = await self.actor.pull_skill_output(skill, msg["key"], sub)
+                if output is None:
+                    break
+                await self.send(
+                    {
+                        "type": "streamed_output",
+                        "uuid": msg["uuid"],
+                        "stream": stream,
+                        "data": output.data,
+                    }
+                )
+        except asyncio.CancelledError:
+            return
+        finally:
+            del self.streams[stream]
+            self.actor.unsubscribe_skill_output(skill, msg["key"], sub)
+        await self.send({"type": "unsubscribed", "stream": stream})
+
+    async def handle_grant_credit(self, msg: dict):
+        stream = self.streams[msg["stream"]]
+        for _ in range(msg["credit"]):
+            stream.credit.release()
+
+    async def handle_unsubscribe_output(self, msg: dict):
+        stream = self.streams.get(msg["stream"])
+        if stream is not None:
+            stream.task.cancel()
+            await asyncio.wait([stream.task])
+        await self.send({"type": "unsubscribed", "stream": msg["stream"]})
+
     async def handle_default(self, msg: dict):
         self.log.warning("Websocket message of type `%s` unknown.", msg["type"])
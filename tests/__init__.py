@@ -11,6 +11,15 @@ def pytest():
     sys.exit(main(["-c", "tests/pytest.ini"] + sys.argv[1:]))
 
 
+def benchmark():
+    """Entry point for pytest as Poetry command that runs only the benchmarks.
+    """
+    from pytest import main
+
+    args = ["-o", "python_files=bench_*.py", "-p", "no:xdist", "--no-cov", "-s"]
+    sys.exit(main(["-c", "tests/pytest.ini"] + args + sys.argv[1:]))
+
+
 def pylint():
     """Entry point for pytest as Poetry command with manually-specified arguments.
     """
@@ -0,0 +1,45 @@
+# genlib — Copyright (c) 2019, Alex J. Champandard. Code licensed under the GNU AGPLv3.
+
+import gc
+import time
+import uuid
+import tracemalloc
+
+from genlib.core.stream import Item
+
+
+REPEATS = 200000
+
+
+class LegacyItem:
+    def __init__(self, data):
+        self.uuid = uuid.uuid1()
+        self.data = data
+
+
+def _measure_time(cls):
+    start = time.perf_counter()
+    for i in range(REPEATS):
+        cls(i)
+    return (time.perf_counter() - start) / REPEATS
+
+
+def _measure_memory(cls):
+    gc.collect()
+    tracemalloc.start()
+    items = [cls(None) for _ in range(REPEATS // 10)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return size / (REPEATS // 10)
+
+
+class TestItemCost:
+    def test_compare_legacy(self):
+        results = {}
+        for cls in (LegacyItem, Item):
+            results[cls] = (_measure_time(cls), _measure_memory(cls))
+            timing, memory = results[cls]
+            print(f"{cls.__name__:>12}: {timing * 1e9:8.1f}ns, {memory:6.1f} bytes")
+        assert results[Item][0] < results[LegacyItem][0]
+        assert results[Item][1] < results[LegacyItem][1]
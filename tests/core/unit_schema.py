@@ -14,6 +14,11 @@ class TestInputDefinitions:
         assert len(data) == 4
         assert set(data.keys()) == {"name", "spec", "defaults", "desc"}
 
+    def test_input_queue_config(self):
+        i = SkillInput("bounded", spec="int", capacity=8, policy="drop_oldest")
+        assert i.capacity == 8 and i.policy == "drop_oldest"
+        assert "capacity" not in i.as_dict()
+
 
 class TestOutputDefinitions:
     def test_output_minimal(self):
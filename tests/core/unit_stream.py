@@ -1,5 +1,6 @@
 # genlib — Copyright (c) 2019, Alex J. Champandard. Code licensed under the GNU AGPLv3.
 
+import pickle
 import unittest
 
 from genlib.core.stream import Item
@@ -9,3 +10,18 @@ class TestStreamItem(unittest.TestCase):
     def test_unique_uuid(self):
         i1, i2 = Item(data=123), Item(data=456)
         assert i1.uuid != i2.uuid
+
+    def test_stable_uuid(self):
+        i = Item(data=123)
+        assert i.uuid == i.uuid
+
+    def test_no_attributes(self):
+        i = Item(data=123)
+        with self.assertRaises(AttributeError):
+            i.custom = 456
+
+    def test_pickle_keeps_uuid(self):
+        i1 = Item(data=[1, 2, 3])
+        i2 = pickle.loads(pickle.dumps(i1))
+        assert i2.data == i1.data
+        assert i2.uuid == i1.uuid
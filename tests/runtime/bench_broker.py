@@ -0,0 +1,63 @@
+# genlib — Copyright (c) 2019, Alex J. Champandard. Code licensed under the GNU AGPLv3.
+
+import time
+import pytest
+
+from genlib.runtime.broker import Broker
+
+
+# All the tests in this file can be treated as asynchronous.
+pytestmark = pytest.mark.asyncio
+
+
+SUBSCRIBER_COUNTS = (10, 100, 1000, 10000)
+REPEATS = 2000
+
+
+async def _measure_receive(count):
+    broker = Broker()
+    broker.create_channel("abcd")
+    subs = [broker.subscribe("abcd") for _ in range(count)]
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        sub = broker.subscribe("abcd")
+        sub.cancel()
+        await broker.receive("abcd", sub)
+        broker.unsubscribe("abcd", sub)
+    elapsed = time.perf_counter() - start
+
+    for sub in subs:
+        broker.unsubscribe("abcd", sub)
+    await broker.shutdown()
+    return elapsed / REPEATS
+
+
+async def _measure_publish(count):
+    broker = Broker()
+    broker.create_channel("abcd")
+    subs = [broker.subscribe("abcd", policy="latest") for _ in range(count)]
+
+    repeats = max(10, REPEATS * 10 // count)
+    start = time.perf_counter()
+    for i in range(repeats):
+        await broker.publish("abcd", i)
+    elapsed = time.perf_counter() - start
+
+    assert all(s._queue.qsize() == 1 for s in subs)
+    await broker.shutdown()
+    return elapsed / (repeats * count)
+
+
+class TestBrokerScaling:
+    async def test_receive_cost_is_flat(self):
+        timings = [await _measure_receive(c) for c in SUBSCRIBER_COUNTS]
+        for count, timing in zip(SUBSCRIBER_COUNTS, timings):
+            print(f"receive with {count:>6} subscribers: {timing * 1e6:8.2f}µs")
+        assert timings[-1] < timings[0] * 3.0
+
+    async def test_publish_cost_per_subscriber_is_flat(self):
+        timings = [await _measure_publish(c) for c in SUBSCRIBER_COUNTS]
+        for count, timing in zip(SUBSCRIBER_COUNTS, timings):
+            print(f"publish to {count:>6} subscribers: {timing * 1e6:8.2f}µs each")
+        assert timings[-1] < timings[0] * 3.0
@@ -33,6 +33,26 @@ class ReactiveSkill(Skill):
         return {"D": Item(data=c.data - 1)}
 
 
+class BlockingSkill(Skill):
+
+    inputs = [Input("E", spec="int")]
+    outputs = [Output("F", spec="int")]
+
+    def process(self):
+        e, = self.io.pull_inputs_blocking("E")
+        return {"F": Item(data=e.data * 2)}
+
+
+class LatestSkill(Skill):
+
+    inputs = [Input("G", spec="int", policy="latest")]
+    outputs = [Output("H", spec="int")]
+
+    async def process(self):
+        g, = await self.io.pull_inputs("G")
+        return {"H": g}
+
+
 @pytest.fixture
 def passive_skill():
     yield PassiveSkill()
@@ -75,6 +95,24 @@ class TestInterpreterOneSkill:
         result = await sub.get()
         assert result.data == 999
 
+    async def test_blocking_pulls_inputs(self, interpreter):
+        skill = BlockingSkill()
+        await interpreter.launch(skill)
+        await interpreter.push_skill_input(skill, "E", Item(1000))
+
+        result = await interpreter.pull_skill_output(skill, "F")
+        assert result.data == 2000
+
+    async def test_input_queue_policy(self, interpreter):
+        skill = LatestSkill()
+        await interpreter.launch(skill)
+        for i in range(10):
+            await interpreter.push_skill_input(skill, "G", Item(i))
+        assert interpreter.get_dropped_count(skill, "G") == 9
+
+        result = await interpreter.pull_skill_output(skill, "H")
+        assert result.data == 9
+
     # 1-in-1-out
     #   skill that actively pulls value
 
@@ -3,7 +3,7 @@
 import pytest
 import asyncio
 
-from genlib.runtime.broker import Broker
+from genlib.runtime.broker import Broker, PublishError
 
 
 # All the tests in this file can be treated as asynchronous.
@@ -44,7 +44,7 @@ class TestBrokerPassive:
     async def test_receive_cancel(self, broker):
         async def cancel():
             await asyncio.sleep(0.01)
-            sub = broker._channels["abcd"].subscriptions[0]
+            sub = next(iter(broker._channels["abcd"].subscriptions))
             sub.cancel()
             await broker.publish("abcd", 1234)
 
@@ -85,6 +85,34 @@ class TestBrokerActive:
 
         broker.remove_callback("abcd", callback)
 
+    async def test_callback_unsubscribe(self, broker):
+        async def callback(channel, message):
+            pass
+
+        sub = broker.add_callback("abcd", callback)
+        broker.unsubscribe("abcd", sub)
+        assert broker.get_subscription_count("abcd") == 0
+        assert len(broker._channels["abcd"].callbacks) == 0
+
+    async def test_callback_twice(self, broker):
+        async def callback(channel, message):
+            pass
+
+        broker.add_callback("abcd", callback)
+        with pytest.raises(AssertionError):
+            broker.add_callback("abcd", callback)
+        broker.remove_callback("abcd", callback)
+
+    async def test_unsubscribe_during_publish(self, broker):
+        async def callback(channel, message):
+            broker.unsubscribe("abcd", sub)
+
+        broker.add_callback("abcd", callback)
+        sub = broker.subscribe("abcd")
+        await broker.publish("abcd", 1234)
+        assert broker.get_subscription_count("abcd") == 1
+        broker.remove_callback("abcd", callback)
+
     async def test_callback(self, broker):
         async def callback(channel, message):
             data.append((channel, message))
@@ -95,3 +123,114 @@ class TestBrokerActive:
         assert data == [("abcd", 5678)]
 
         broker.remove_callback("abcd", callback)
+
+
+class TestBrokerBounded:
+    async def _receive_all(self, sub):
+        return [sub._queue.get_nowait() for _ in range(sub._queue.qsize())]
+
+    async def test_unbounded_by_default(self, broker):
+        sub = broker.subscribe("abcd")
+        for i in range(100):
+            await broker.publish("abcd", i)
+        assert sub._queue.qsize() == 100
+
+    async def test_block_publisher(self, broker):
+        sub = broker.subscribe("abcd", capacity=2, policy="block")
+        for i in range(2):
+            await broker.publish("abcd", i)
+
+        task = asyncio.create_task(broker.publish("abcd", 2))
+        await asyncio.sleep(0.01)
+        assert not task.done()
+
+        assert await sub.get() == 0
+        await asyncio.sleep(0.01)
+        assert task.done()
+        assert await self._receive_all(sub) == [1, 2]
+        assert broker.get_dropped_count("abcd") == 0
+
+    async def test_drop_oldest(self, broker):
+        sub = broker.subscribe("abcd", capacity=2, policy="drop_oldest")
+        for i in range(5):
+            await broker.publish("abcd", i)
+        assert await self._receive_all(sub) == [3, 4]
+        assert broker.get_dropped_count("abcd") == 3
+
+    async def test_drop_newest(self, broker):
+        sub = broker.subscribe("abcd", capacity=2, policy="drop_newest")
+        for i in range(5):
+            await broker.publish("abcd", i)
+        assert await self._receive_all(sub) == [0, 1]
+        assert broker.get_dropped_count("abcd") == 3
+
+    async def test_latest(self, broker):
+        sub = broker.subscribe("abcd", policy="latest")
+        for i in range(5):
+            await broker.publish("abcd", i)
+        assert await self._receive_all(sub) == [4]
+        assert broker.get_dropped_count("abcd") == 4
+
+    async def test_cancel_full_queue(self, broker):
+        sub = broker.subscribe("abcd", capacity=1, policy="block")
+        await broker.publish("abcd", 1)
+        sub.cancel()
+        assert await sub.get() is None
+
+    async def test_unknown_policy(self, broker):
+        with pytest.raises(AssertionError):
+            broker.subscribe("abcd", capacity=1, policy="unknown")
+
+
+@pytest.fixture
+async def concurrent_broker():
+    b = Broker(concurrency=2)
+    b.create_channel("abcd")
+    yield b
+    await b.shutdown()
+
+
+class TestBrokerConcurrent:
+    def _make_callback(self, delay, log):
+        async def callback(channel, message):
+            log.append(("start", delay))
+            await asyncio.sleep(delay)
+            log.append(("end", delay))
+
+        return callback
+
+    async def test_sequential_by_default(self, broker):
+        log = []
+        for delay in (0.02, 0.01):
+            broker.add_callback("abcd", self._make_callback(delay, log))
+        await broker.publish("abcd", 1234)
+        assert [e for e, _ in log] == ["start", "end", "start", "end"]
+
+    async def test_slow_subscriber_not_blocking(self, concurrent_broker):
+        log = []
+        for delay in (0.02, 0.01):
+            concurrent_broker.add_callback("abcd", self._make_callback(delay, log))
+        await concurrent_broker.publish("abcd", 1234)
+        assert log[-1] == ("end", 0.02)
+        assert log.index(("end", 0.01)) < log.index(("end", 0.02))
+
+    async def test_concurrency_limit(self, concurrent_broker):
+        log = []
+        for delay in (0.01, 0.02, 0.03):
+            concurrent_broker.add_callback("abcd", self._make_callback(delay, log))
+        await concurrent_broker.publish("abcd", 1234)
+        assert log.index(("end", 0.01)) < log.index(("start", 0.03))
+
+    async def test_errors_gathered(self, concurrent_broker):
+        async def failure(channel, message):
+            raise NotImplementedError
+
+        log = []
+        concurrent_broker.add_callback("abcd", failure)
+        concurrent_broker.add_callback("abcd", self._make_callback(0.01, log))
+        with pytest.raises(PublishError) as info:
+            await concurrent_broker.publish("abcd", 1234)
+
+        assert len(info.value.errors) == 1
+        assert isinstance(info.value.errors[0][1], NotImplementedError)
+        assert log[-1] == ("end", 0.01)
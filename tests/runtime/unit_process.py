@@ -0,0 +1,89 @@
+# genlib — Copyright (c) 2019, Alex J. Champandard. Code licensed under the GNU AGPLv3.
+
+import os
+import pytest
+
+from genlib.core.stream import Item
+from genlib.core.skills import Skill, Input, Output
+from genlib.runtime.interpreter import Interpreter
+from genlib.runtime.process import ProcessScheduler
+
+
+# All the tests in this file can be treated as asynchronous.
+pytestmark = pytest.mark.asyncio
+
+
+class WorkerSkill(Skill):
+    outputs = [Output("pid", spec="int")]
+
+    async def on_initialize(self):
+        self.counter = 0
+
+    async def process(self):
+        self.counter += 1
+        return {"pid": (os.getpid(), self.counter)}
+
+
+class IncrementSkill(Skill):
+    inputs = [Input("A", spec="int")]
+    outputs = [Output("B", spec="int")]
+
+    async def process(self):
+        a, = await self.io.pull_inputs("A")
+        return {"B": Item(data=a.data + 1)}
+
+
+class ProblemSkill(Skill):
+    outputs = [Output("wrong", spec="float")]
+
+    async def process(self):
+        raise NotImplementedError
+
+
+@pytest.fixture
+async def scheduler():
+    s = ProcessScheduler()
+    yield s
+    await s.shutdown()
+
+
+class TestProcessScheduler:
+    async def test_spawn_halt(self, scheduler):
+        skill = WorkerSkill()
+        await scheduler.spawn(skill)
+        assert scheduler.get_active_skill_count() == 1
+        await scheduler.halt(skill)
+        assert scheduler.get_active_skill_count() == 0
+
+    async def test_step_runs_in_worker(self, scheduler):
+        skill = WorkerSkill()
+        await scheduler.spawn(skill)
+        for i in range(1, 4):
+            result = await scheduler.step(skill, WorkerSkill.process)
+            assert result["pid"] == (result["pid"][0], i)
+            assert result["pid"][0] != os.getpid()
+        assert not hasattr(skill, "counter")
+
+    async def test_isolate_predicate(self):
+        scheduler = ProcessScheduler(isolate=lambda s: False)
+        skill = WorkerSkill()
+        await scheduler.spawn(skill)
+        result = await scheduler.step(skill, WorkerSkill.process)
+        assert result["pid"] == (os.getpid(), 1)
+        await scheduler.shutdown()
+
+    async def test_exception_is_forwarded(self, scheduler):
+        skill = ProblemSkill()
+        await scheduler.spawn(skill)
+        with pytest.raises(NotImplementedError):
+            await scheduler.step(skill, ProblemSkill.process)
+
+    async def test_interpreter_pulls_inputs(self, scheduler):
+        interpreter = Interpreter(scheduler=scheduler)
+        skill = IncrementSkill()
+        await interpreter.launch(skill)
+
+        await interpreter.push_skill_input(skill, "A", Item(1000))
+        result = await interpreter.pull_skill_output(skill, "B")
+        assert result.data == 1001
+        await interpreter.shutdown()
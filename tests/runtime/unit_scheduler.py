@@ -1,8 +1,11 @@
 # genlib — Copyright (c) 2019, Alex J. Champandard. Code licensed under the GNU AGPLv3.
 
+import time
 import pytest
+import asyncio
+import threading
 
-from genlib.core.skills import Skill, Output
+from genlib.core.skills import Skill, Output, provides, batching, blocking
 from genlib.runtime.scheduler import Scheduler
 
 
@@ -27,6 +30,36 @@ class ProblemSkill(Skill):
         raise NotImplementedError
 
 
+class BatchSkill(Skill):
+    outputs = [Output("sizes", spec="int")]
+
+    async def on_initialize(self):
+        self.batches = []
+
+    @provides("sizes")
+    @batching(max_size=4)
+    async def process(self, count):
+        self.batches.append(count)
+        return [{"sizes": count}] * count
+
+    async def other(self):
+        return {"sizes": 0}
+
+
+class BlockingSkill(Skill):
+    outputs = [Output("thread", spec="str"), Output("marked", spec="str")]
+
+    @provides("thread")
+    def process(self):
+        time.sleep(0.05)
+        return {"thread": threading.current_thread().name}
+
+    @provides("marked")
+    @blocking
+    def marked(self):
+        return {"marked": threading.current_thread().name}
+
+
 @pytest.fixture
 def fake_skill():
     yield FakeSkill()
@@ -104,3 +137,74 @@ class TestSchedulerErrorHandling:
         await scheduler.spawn(problem_skill)
         with pytest.raises(NotImplementedError):
             await scheduler.step(problem_skill, ProblemSkill.process)
+
+
+@pytest.fixture
+def batch_skill():
+    yield BatchSkill()
+
+
+class TestSchedulerBatching:
+    async def test_single_request(self, scheduler, batch_skill):
+        await scheduler.spawn(batch_skill)
+        result = await scheduler.step(batch_skill, BatchSkill.process)
+        assert result == {"sizes": 1}
+
+    async def test_queued_requests_grouped(self, scheduler, batch_skill):
+        await scheduler.spawn(batch_skill)
+        steps = [scheduler.step(batch_skill, BatchSkill.process) for _ in range(10)]
+        results = await asyncio.gather(*steps)
+        assert batch_skill.batches == [4, 4, 2]
+        assert [r["sizes"] for r in results] == [4] * 8 + [2] * 2
+
+    async def test_batch_interrupted_by_other_function(self, scheduler, batch_skill):
+        await scheduler.spawn(batch_skill)
+        steps = [
+            scheduler.step(batch_skill, BatchSkill.process),
+            scheduler.step(batch_skill, BatchSkill.other),
+            scheduler.step(batch_skill, BatchSkill.process),
+        ]
+        results = await asyncio.gather(*steps)
+        assert batch_skill.batches == [1, 1]
+        assert results == [{"sizes": 1}, {"sizes": 0}, {"sizes": 1}]
+
+    async def test_batch_waits_until_deadline(self, scheduler, batch_skill):
+        BatchSkill.process._genlib["batching"]["timeout"] = 0.05
+        try:
+            await scheduler.spawn(batch_skill)
+            first = asyncio.create_task(scheduler.step(batch_skill, BatchSkill.process))
+            await asyncio.sleep(0.01)
+            second = await scheduler.step(batch_skill, BatchSkill.process)
+            assert (await first) == second == {"sizes": 2}
+        finally:
+            BatchSkill.process._genlib["batching"]["timeout"] = 0.0
+
+
+class TestSchedulerThreads:
+    async def test_regular_method_runs_in_thread(self, scheduler):
+        skill = BlockingSkill()
+        await scheduler.spawn(skill)
+        result = await scheduler.step(skill, BlockingSkill.process)
+        assert result["thread"].startswith("genlib")
+
+    async def test_marked_method_runs_in_thread(self, scheduler):
+        skill = BlockingSkill()
+        await scheduler.spawn(skill)
+        result = await scheduler.step(skill, BlockingSkill.marked)
+        assert result["marked"].startswith("genlib")
+
+    async def test_queue_depth_is_bounded(self):
+        scheduler = Scheduler(max_threads=1)
+        skills = [BlockingSkill() for _ in range(3)]
+        for skill in skills:
+            await scheduler.spawn(skill)
+
+        steps = [
+            asyncio.create_task(scheduler.step(s, BlockingSkill.process)) for s in skills
+        ]
+        await asyncio.sleep(0.01)
+        assert scheduler.get_thread_queue_depth() == 2
+
+        await asyncio.gather(*steps)
+        assert scheduler.get_thread_queue_depth() == 0
+        await scheduler.shutdown()
@@ -0,0 +1,47 @@
+# genlib — Copyright (c) 2019, Alex J. Champandard. Code licensed under the GNU AGPLv3.
+
+import json
+import time
+
+from genlib.web.protocol import find_codec, list_codecs
+
+
+REPEATS = 20000
+MESSAGES = {
+    "push_input": {
+        "type": "push_input",
+        "uuid": "8c4f6a4e2b8e11ea9d5b0242ac130003",
+        "data": {"prompt": "A generative skill", "seed": 1234, "scale": 0.75},
+    },
+    "pulled_output": {
+        "type": "pulled_output",
+        "uuid": "8c4f6a4e2b8e11ea9d5b0242ac130003",
+        "data": [[float(i) for i in range(16)] for _ in range(16)],
+    },
+}
+
+
+class StdlibCodec:
+    name = "stdlib.json"
+
+    def encode(self, msg):
+        return json.dumps(msg)
+
+    def decode(self, data):
+        return json.loads(data)
+
+
+def _measure(codec, msg):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        codec.decode(codec.encode(msg))
+    return REPEATS / (time.perf_counter() - start)
+
+
+class TestCodecThroughput:
+    def test_messages_per_second(self):
+        codecs = [StdlibCodec()] + [find_codec(name) for name in list_codecs()]
+        for key, msg in MESSAGES.items():
+            for codec in codecs:
+                rate = _measure(codec, msg)
+                print(f"{key:>14} {codec.name:>15}: {rate:10.0f} msg/s")
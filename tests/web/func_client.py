@@ -8,6 +8,7 @@ import aiohttp, aiohttp.web, aiohttp.test_utils
 
 from genlib.web.client import Client
 from genlib.web.server import Server
+from genlib.web.protocol import list_codecs
 
 
 # All the tests in this file can be treated as asynchronous.
@@ -28,11 +29,23 @@ class DoEcho(Skill):
         return {"pong": Item(ping_item.data)}
 
 
+class DoReverse(Skill):
+
+    inputs = [Input("buffer", spec="bytes")]
+    outputs = [Output("reversed", spec="bytes")]
+
+    async def process(self):
+        buffer_item, = await self.io.pull_inputs("buffer")
+        return {"reversed": Item(bytes(buffer_item.data)[::-1])}
+
+
 @pytest.fixture()
 async def server():
     server = Server()
     server.registry._load_from_class("test.py:DoEcho", DoEcho)
+    server.registry._load_from_class("test.py:DoReverse", DoReverse)
     server.expose_skill("TestConnection", "test.py:DoEcho")
+    server.expose_skill("TestBinary", "test.py:DoReverse")
 
     runner = aiohttp.test_utils.TestServer(server, host="127.0.0.1")
     await runner.start_server()
@@ -59,7 +72,7 @@ class TestSingle:
     async def test_listing(self, server):
         async with Client(server.url) as client:
             listing = await client.get_listing()
-            assert list(listing["data"].keys()) == ["TestConnection"]
+            assert list(listing["data"].keys()) == ["TestConnection", "TestBinary"]
 
     async def test_invoke_revoke(self, server):
         async with Client(server.url) as client:
@@ -82,6 +95,60 @@ class TestSingle:
                 assert msg["data"] == i
             await client.revoke(skill)
 
+    async def test_push_pull_binary(self, server):
+        async with Client(server.url, codecs=["genlib.json"]) as client:
+            skill = await client.invoke("TestBinary")
+            await client.push_input(skill, "buffer", b"\x00\x01\x02")
+            msg = await client.pull_output(skill, "reversed")
+            assert isinstance(msg["data"], memoryview)
+            assert msg["data"] == b"\x02\x01\x00"
+            await client.revoke(skill)
+
+    @pytest.mark.parametrize("codec", list_codecs())
+    async def test_negotiate_codec(self, server, codec):
+        async with Client(server.url, codecs=[codec]) as client:
+            assert client.codec.name == codec
+            skill = await client.invoke("TestBinary")
+            await client.push_input(skill, "buffer", b"\x00\x01\x02")
+            msg = await client.pull_output(skill, "reversed")
+            assert msg["data"] == b"\x02\x01\x00"
+            await client.revoke(skill)
+
+    async def test_subscribe_output(self, server):
+        async with Client(server.url) as client:
+            skill = await client.invoke("TestConnection")
+            for i in range(10):
+                await client.push_input(skill, "ping", i)
+
+            values = []
+            async with client.subscribe_output(skill, "pong", credit=4) as stream:
+                async for msg in stream:
+                    assert msg["type"] == "streamed_output"
+                    values.append(msg["data"])
+                    if len(values) == 10:
+                        break
+            assert values == list(range(10))
+
+            await client.push_input(skill, "ping", 10)
+            msg = await client.pull_output(skill, "pong")
+            assert msg["data"] == 10
+            await client.revoke(skill)
+
+    async def test_subscribe_credit(self, server):
+        async with Client(server.url) as client:
+            skill = await client.invoke("TestConnection")
+            for i in range(10):
+                await client.push_input(skill, "ping", i)
+
+            session = server.sessions[0]
+            async with client.subscribe_output(skill, "pong", credit=2):
+                await asyncio.sleep(0.05)
+                channel = session.actor.interpreter.subscriptions[
+                    (session.skills[skill["uuid"]], "ping")
+                ]
+                assert channel._queue.qsize() == 8
+            await client.revoke(skill)
+
 
 class TestMultiple:
     async def test_push_pull(self, server):
@@ -0,0 +1,69 @@
+# genlib — Copyright (c) 2019, Alex J. Champandard. Code licensed under the GNU AGPLv3.
+
+import pytest
+
+from genlib.web.protocol import encode_frame, decode_frame, find_codec, list_codecs
+
+
+class TestBinaryFrames:
+    def test_no_binary_data(self):
+        assert encode_frame({"type": "listing"}) is None
+        assert encode_frame({"type": "push_input", "data": {"A": 1}}) is None
+
+    def test_direct_data(self):
+        msg = {"type": "pulled_output", "uuid": "abcd", "data": b"\x00\x01\x02"}
+        result = decode_frame(encode_frame(msg))
+        assert isinstance(result["data"], memoryview)
+        assert result == dict(msg, data=result["data"])
+        assert result["data"].tobytes() == b"\x00\x01\x02"
+
+    def test_dictionary_data(self):
+        msg = {"type": "push_input", "data": {"A": b"1234", "B": 5, "C": bytearray(2)}}
+        result = decode_frame(encode_frame(msg))
+        assert result["data"]["A"].tobytes() == b"1234"
+        assert result["data"]["B"] == 5
+        assert result["data"]["C"].tobytes() == b"\x00\x00"
+
+    def test_parameters(self):
+        msg = {"type": "invoke", "parameters": {"A": b"1234"}}
+        result = decode_frame(encode_frame(msg))
+        assert result["parameters"]["A"].tobytes() == b"1234"
+        assert "data" not in result
+
+    def test_views_into_frame(self):
+        frame = bytearray(encode_frame({"data": b"abcd"}))
+        result = decode_frame(frame)
+        frame[-1] = ord("z")
+        assert result["data"].tobytes() == b"abcz"
+
+    def test_multidimensional_buffer(self):
+        view = memoryview(bytearray(range(6))).cast("B", shape=[2, 3])
+        result = decode_frame(encode_frame({"data": view}))
+        assert result["data"].tobytes() == bytes(range(6))
+
+
+class TestCodecs:
+    def test_default_json(self):
+        assert find_codec(None).name == "genlib.json"
+        assert "genlib.json" in list_codecs()
+
+    def test_unknown(self):
+        with pytest.raises(AssertionError):
+            find_codec("genlib.unknown")
+
+    def test_round_trip(self):
+        msg = {"type": "push_input", "uuid": "abcd", "data": {"A": [1, 2.5, "3"]}}
+        for name in list_codecs():
+            codec = find_codec(name)
+            assert codec.decode(codec.encode(msg)) == msg
+
+    def test_json_binary_frame(self):
+        codec = find_codec("genlib.json")
+        data = codec.encode({"data": b"1234"})
+        assert isinstance(data, bytes)
+        assert codec.decode(data)["data"] == b"1234"
+
+    def test_msgpack_binary_inline(self):
+        pytest.importorskip("msgpack")
+        codec = find_codec("genlib.msgpack")
+        assert codec.decode(codec.encode({"data": memoryview(b"12")})) == {"data": b"12"}
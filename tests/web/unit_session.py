@@ -1,5 +1,6 @@
 # genlib — Copyright (c) 2019, Alex J. Champandard. Code licensed under the GNU AGPLv3.
 
+import json
 import pytest
 import asyncio
 import logging
@@ -8,6 +9,7 @@ import aiohttp
 
 from genlib.runtime.actor import Actor
 from genlib.web.session import UserSession
+from genlib.web.protocol import encode_frame
 
 
 # All the tests in this file can be treated as asynchronous.
@@ -23,7 +25,10 @@ async def session(caplog, mocker):
             while True:
                 yield await messages.get()
 
-        async def send_json(self, data):
+        async def send_str(self, data):
+            self.data = json.loads(data)
+
+        async def send_bytes(self, data):
             self.data = data
 
     session = UserSession(websock=MockWebSocket(), actor=mocker.Mock(Actor))
@@ -85,3 +90,14 @@ class TestSession:
 
     async def test_connect(self, session):
         await self._put_message(session, '{"type": "connect"}')
+
+    async def test_push_binary(self, session):
+        session.skills["abcd"] = skill = object()
+        frame = encode_frame({"type": "push_input", "uuid": "abcd", "data": {"A": b"1"}})
+        msg = aiohttp.WSMessage(aiohttp.web.WSMsgType.BINARY, data=frame, extra="")
+        await session._messages.put(msg)
+        await asyncio.sleep(0.001)
+
+        (target, key, value), _ = session.actor.push_skill_input.call_args
+        assert target is skill and key == "A"
+        assert isinstance(value, memoryview) and value == b"1"